@@ -1,145 +1,83 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime
-import requests
-import json
+from typing import NamedTuple
 
-# Helper function for ROI calculation - MOVED TO TOP
-def calculate_solar_roi(inputs):
-    """
-    Enhanced ROI calculation with weather integration
-    """
-    # Basic assumptions (adjusted based on weather conditions)
-    base_solar_irradiance = 5.5  # kWh/m²/day (average for India)
-    system_efficiency = 0.85
-    panel_cost_per_kw = 45000  # ₹45,000 per kW
-    installation_cost_ratio = 0.3  # 30% of panel cost
-    
-    # Weather adjustment factors
-    weather_factors = {
-        'Sunny': 1.0,
-        'Mostly Sunny': 0.95,
-        'Partly Cloudy': 0.85,
-        'Cloudy': 0.70,
-        'Rainy': 0.60,
-        'Very Cloudy': 0.50
-    }
-    
-    # Season adjustment factors
-    season_factors = {
-        'Summer': 1.15,
-        'Winter': 0.80,
-        'Monsoon': 0.65,
-        'Post-Monsoon': 0.90
-    }
-    
-    # Apply weather adjustments
-    weather_factor = weather_factors.get(inputs.get('weather_condition', 'Sunny'), 1.0)
-    season_factor = season_factors.get(inputs.get('dominant_season', 'Summer'), 1.0)
-    
-    # Adjust solar irradiance based on weather
-    adjusted_irradiance = base_solar_irradiance * weather_factor * season_factor
-    
-    # Additional weather-based adjustments
-    dust_factor = 1.0
-    if inputs.get('dust_pollution', 'Low') == 'High':
-        dust_factor = 0.85
-    elif inputs.get('dust_pollution', 'Low') == 'Medium':
-        dust_factor = 0.92
-    
-    # Final irradiance calculation
-    solar_irradiance = adjusted_irradiance * dust_factor
-    
-    # Calculate system size needed
-    monthly_consumption = inputs['monthly_units']
-    system_size = (monthly_consumption * 12) / (solar_irradiance * 365 * system_efficiency)
-    
-    # Adjust for roof area constraint
-    max_system_size = (inputs['rooftop_area'] * 0.7) / 100  # 70% of roof area, 100 sq ft per kW
-    system_size = min(system_size, max_system_size)
-    
-    # Calculate costs
-    panel_cost = system_size * panel_cost_per_kw
-    installation_cost = panel_cost * installation_cost_ratio
-    total_investment = panel_cost + installation_cost
-    
-    # Calculate generation with weather considerations
-    annual_generation = system_size * solar_irradiance * 365 * system_efficiency
-    daily_average = annual_generation / 365
-    
-    # Monthly generation with weather-adjusted seasonal variation
-    base_monthly_factors = [0.85, 0.9, 1.0, 1.1, 1.15, 1.1, 1.05, 1.0, 0.95, 0.9, 0.85, 0.8]
-    
-    # Adjust monthly factors based on weather patterns
-    if inputs.get('dominant_season') == 'Monsoon':
-        # Reduce generation during monsoon months (Jun-Sep)
-        monsoon_adjustment = [1.0, 1.0, 1.0, 1.0, 1.0, 0.7, 0.6, 0.6, 0.8, 1.0, 1.0, 1.0]
-        monthly_gen_factors = [base_monthly_factors[i] * monsoon_adjustment[i] for i in range(12)]
-    else:
-        monthly_gen_factors = base_monthly_factors
-    
-    monthly_generation = [annual_generation * factor / 12 for factor in monthly_gen_factors]
-    
-    # Calculate savings
-    monthly_savings = min(monthly_consumption, annual_generation/12) * (inputs['monthly_bill']/monthly_consumption)
-    annual_savings = monthly_savings * 12
-    
-    # Calculate payback
-    payback_years = total_investment / annual_savings if annual_savings > 0 else 999
-    
-    # 20-year projections
-    years = list(range(1, 21))
-    cumulative_savings = [annual_savings * year for year in years]
-    total_20_year_savings = annual_savings * 20
-    net_profit = total_20_year_savings - total_investment
-    
-    # Determine suitability with weather considerations
-    weather_score_adjustment = weather_factor * 10  # Scale weather impact
-    base_score = 60
-    
-    if payback_years < 5 and annual_generation > monthly_consumption * 10:
-        suitability = "Excellent"
-        solar_score = min(90, base_score + 30 + weather_score_adjustment)
-    elif payback_years < 7 and annual_generation > monthly_consumption * 8:
-        suitability = "Good"
-        solar_score = min(85, base_score + 15 + weather_score_adjustment)
-    else:
-        suitability = "Average"
-        solar_score = min(75, base_score + weather_score_adjustment)
-    
-    return {
-        'suitability': suitability,
-        'solar_score': solar_score,
-        'system_size': system_size,
-        'total_investment': total_investment,
-        'annual_generation': annual_generation,
-        'daily_average': daily_average,
-        'peak_sun_hours': solar_irradiance,
-        'monthly_generation': monthly_generation,
-        'monthly_savings': monthly_savings,
-        'annual_savings': annual_savings,
-        'payback_years': payback_years,
-        'annual_roi': (annual_savings / total_investment) * 100 if total_investment > 0 else 0,
-        'cumulative_savings': cumulative_savings,
-        'total_20_year_savings': total_20_year_savings,
-        'net_profit': net_profit,
-        'weather_impact': weather_factor,
-        'effective_irradiance': solar_irradiance
-    }
+# Weather adjustment factors
+_WEATHER_FACTORS = {
+    'Sunny': 1.0,
+    'Mostly Sunny': 0.95,
+    'Partly Cloudy': 0.85,
+    'Cloudy': 0.70,
+    'Rainy': 0.60,
+    'Very Cloudy': 0.50
+}
 
-# Page configuration
-st.set_page_config(
-    page_title="Smart Solar ROI Predictor for MSMEs",
-    page_icon="☀️",
-    layout="wide",
-    initial_sidebar_state="expanded"
+# Season adjustment factors
+_SEASON_FACTORS = {
+    'Summer': 1.15,
+    'Winter': 0.80,
+    'Monsoon': 0.65,
+    'Post-Monsoon': 0.90
+}
+
+# Dust/pollution adjustment factors
+_DUST_FACTORS = {
+    'Low': 1.0,
+    'Medium': 0.92,
+    'High': 0.85
+}
+
+# Effective irradiance for every weather/season/dust combination
+_BASE_SOLAR_IRRADIANCE = 5.5  # kWh/m²/day (average for India)
+_IRRADIANCE_TABLE = {
+    (weather, season, dust): _BASE_SOLAR_IRRADIANCE * wf * sf * df
+    for weather, wf in _WEATHER_FACTORS.items()
+    for season, sf in _SEASON_FACTORS.items()
+    for dust, df in _DUST_FACTORS.items()
+}
+
+# Suitability ladder, first match wins: (payback below N years, annual generation
+# above N x monthly consumption, label, score bonus, score cap)
+_SUITABILITY_LADDER = (
+    (5, 10, "Excellent", 30, 90),
+    (7, 8, "Good", 15, 85)
 )
+_SUITABILITY_DEFAULT = ("Average", 0, 75)
+
+# Monthly generation profile (Jan-Dec) and monsoon derating for Jun-Sep
+_BASE_MONTHLY = np.array([0.85, 0.9, 1.0, 1.1, 1.15, 1.1, 1.05, 1.0, 0.95, 0.9, 0.85, 0.8])
+_MONSOON_ADJ = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 0.7, 0.6, 0.6, 0.8, 1.0, 1.0, 1.0])
+# Installed cost per kW: ₹45,000 panel cost plus 30% for installation
+_TOTAL_COST_PER_KW = 45000 * 1.3
+_KW_PER_SQFT = 0.7 / 100  # 70% of roof area usable, 100 sq ft per kW
+_INV_12 = 1.0 / 12.0
+_INV_365 = 1.0 / 365.0
+# Share of annual generation produced in each month
+_MONTHLY_GEN_FACTORS = _BASE_MONTHLY * _INV_12
+_MONSOON_MONTHLY_GEN_FACTORS = _BASE_MONTHLY * _MONSOON_ADJ * _INV_12
+_YEARS = np.arange(1, 21)  # 20-year projection horizon
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Weather-specific insight rules: (input key, triggering values, message)
+_WEATHER_RULES = (
+    ('weather_condition', {'Cloudy', 'Very Cloudy'}, "⚠️ Consider high-efficiency panels for cloudy conditions"),
+    ('dust_pollution', {'High'}, "🧹 Plan for regular panel cleaning (monthly)"),
+    ('dominant_season', {'Monsoon'}, "☔ Consider waterproof mounting and drainage systems"),
+    ('monsoon_intensity', {'Heavy', 'Very Heavy'}, "🌧️ Ensure robust structural support for heavy rains"),
+    ('wind_conditions', {'Strong Wind', 'Very Windy'}, "💨 Install wind-resistant mounting systems")
+)
+
+# Page header banner
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🌞 Smart Solar ROI Predictor for MSMEs</h1>
+    <p>Discover if solar energy is right for your business - Get instant ROI analysis with weather intelligence!</p>
+</div>
+"""
 
 # Custom CSS for better styling
-st.markdown("""
+_CUSTOM_CSS = """
 <style>
     .main-header {
         background: linear-gradient(90deg, #ff6b35, #f7931e);
@@ -170,15 +108,212 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Business locations, each group written in alphabetical order so nothing is sorted
+# at runtime. Chandigarh, Delhi and Puducherry are listed once, as cities.
+_INDIAN_CITIES = (
+    "Agartala", "Agra", "Ahmedabad", "Ahmednagar", "Aizawl", "Ajmer", "Akola", "Alappuzha", "Aligarh",
+    "Allahabad", "Alwar", "Ambala", "Amravati", "Amritsar", "Anand", "Anantapur", "Asansol", "Aurangabad",
+    "Azamgarh", "Bangalore", "Baran", "Bareilly", "Bathinda", "Begusarai", "Belagavi", "Bellary",
+    "Berhampur", "Bhagalpur", "Bharatpur", "Bharuch", "Bhavnagar", "Bhilai", "Bhilwara", "Bhopal",
+    "Bhubaneswar", "Bhuj", "Bidar", "Bikaner", "Bilaspur", "Bokaro", "Chandigarh", "Chandrapur", "Chennai",
+    "Chhindwara", "Chittoor", "Coimbatore", "Cuttack", "Daman", "Darbhanga", "Darjeeling", "Davanagere",
+    "Dehradun", "Delhi", "Dewas", "Dhanbad", "Dhar", "Dhule", "Dibrugarh", "Dindigul", "Dispur", "Durg",
+    "Durgapur", "Erode", "Etawah", "Faizabad", "Faridabad", "Farrukhabad", "Fatehpur", "Firozabad",
+    "Gandhinagar", "Gaya", "Ghaziabad", "Ghazipur", "Gorakhpur", "Greater Noida", "Gulbarga", "Guna",
+    "Guntur", "Gurgaon", "Guwahati", "Gwalior", "Hajipur", "Haldia", "Haldwani", "Haridwar", "Hassan",
+    "Hisar", "Hosur", "Hubli", "Hyderabad", "Ichalkaranji", "Imphal", "Indore", "Itanagar", "Jabalpur",
+    "Jagdalpur", "Jagraon", "Jaipur", "Jalandhar", "Jalgaon", "Jammu", "Jamnagar", "Jamshedpur", "Jhansi",
+    "Jhunjhunu", "Jodhpur", "Junagadh", "Kadapa", "Kaithal", "Kakinada", "Kalaburagi", "Kalyan",
+    "Kanchipuram", "Kannur", "Kanpur", "Kapurthala", "Karimnagar", "Karnal", "Karur", "Katni", "Kharagpur",
+    "Kochi", "Kolhapur", "Kolkata", "Kollam", "Korba", "Kota", "Kottayam", "Kozhikode", "Krishnanagar",
+    "Kurnool", "Latur", "Loni", "Lucknow", "Ludhiana", "Madurai", "Maheshtala", "Malda", "Malegaon",
+    "Mangalore", "Mathura", "Meerut", "Mirzapur", "Moradabad", "Morena", "Mumbai", "Muzaffarnagar",
+    "Muzaffarpur", "Mysore", "Nadiad", "Nagapattinam", "Nagercoil", "Nagpur", "Nanded", "Nashik",
+    "Navi Mumbai", "Neemuch", "Nellore", "Nizamabad", "Noida", "Ongole", "Ooty", "Orai", "Palakkad",
+    "Palanpur", "Pali", "Panaji", "Panchkula", "Panipat", "Parbhani", "Pathankot", "Patiala", "Patna",
+    "Pimpri-Chinchwad", "Porbandar", "Prayagraj", "Puducherry", "Pune", "Puri", "Raebareli", "Raichur",
+    "Raigarh", "Raipur", "Rajahmundry", "Rajkot", "Ranchi", "Ratlam", "Rewa", "Rewari", "Rohtak", "Roorkee",
+    "Rourkela", "Sagar", "Saharanpur", "Salem", "Sambalpur", "Sangli", "Sangrur", "Satara", "Satna",
+    "Secunderabad", "Serampore", "Shillong", "Shimla", "Shivpuri", "Sikar", "Silchar", "Siliguri", "Solapur",
+    "Sonipat", "Srinagar", "Surat", "Tenali", "Tezpur", "Thane", "Thanjavur", "Thiruvananthapuram",
+    "Thoothukudi", "Thrissur", "Tinsukia", "Tiruchirappalli", "Tirunelveli", "Tirupati", "Tiruppur",
+    "Tiruvannamalai", "Udaipur", "Udupi", "Ujjain", "Ulhasnagar", "Una", "Unnao", "Vadodara", "Valsad",
+    "Varanasi", "Vasai-Virar", "Vellore", "Vidisha", "Vijayawada", "Viluppuram", "Virar", "Visakhapatnam",
+    "Warangal", "Wardha", "Yamunanagar"
+)
+_INDIAN_STATES_UTS = (
+    "Andaman and Nicobar Islands", "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh",
+    "Dadra and Nagar Haveli and Daman and Diu", "Goa", "Gujarat", "Haryana", "Himachal Pradesh",
+    "Jammu and Kashmir", "Jharkhand", "Karnataka", "Kerala", "Ladakh", "Lakshadweep", "Madhya Pradesh",
+    "Maharashtra", "Manipur", "Meghalaya", "Mizoram", "Nagaland", "Odisha", "Punjab", "Rajasthan", "Sikkim",
+    "Tamil Nadu", "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal"
+)
+_LOCATIONS = _INDIAN_CITIES + _INDIAN_STATES_UTS
+_LOCATION_SET = frozenset(_LOCATIONS)  # O(1) location validation
+_STATE_UT_SET = frozenset(_INDIAN_STATES_UTS)  # tags the second group in the selectbox
+
+# Default values for keyed input widgets
+_WIDGET_DEFAULTS = {
+    'area_method': "Manual Input",
+    'bill_method': "Monthly Bill Amount",
+    'previous_solar': "No",
+    'rooftop_area': 1000,
+    'building_length': 50,
+    'building_width': 40,
+    'monthly_bill': 15000,
+    'monthly_units': 2000,
+    'avg_tariff': 6.5,
+    'operating_hours': 10,
+    'sunny_days': 20
+}
+
+# Result of calculate_solar_roi
+class ROI(NamedTuple):
+    suitability: str
+    solar_score: float
+    system_size: float
+    total_investment: float
+    annual_generation: float
+    daily_average: float
+    peak_sun_hours: float
+    monthly_generation: np.ndarray
+    monthly_savings: float
+    annual_savings: float
+    payback_years: float
+    annual_roi: float
+    cumulative_savings: np.ndarray
+    total_20_year_savings: float
+    net_profit: float
+    weather_impact: float
+    effective_irradiance: float
+
+# Scalar ROI arithmetic - floats in, floats out (no dict lookups)
+def _roi_math(monthly_units, tariff, rooftop_area, solar_irradiance):
+    """
+    Size the system and compute costs, generation, savings and payback
+    """
+    system_efficiency = 0.85
+    
+    # Annual output of 1 kW under these weather conditions (kWh/kW/year)
+    annual_yield_per_kw = solar_irradiance * 365.0 * system_efficiency
+    
+    # Calculate system size needed, capped by the roof area
+    system_size = min(monthly_units * 12.0 / annual_yield_per_kw,
+                      rooftop_area * _KW_PER_SQFT)
+    
+    # Calculate costs (panels plus installation)
+    total_investment = system_size * _TOTAL_COST_PER_KW
+    
+    # Calculate generation with weather considerations
+    annual_generation = system_size * annual_yield_per_kw
+    daily_average = annual_generation * _INV_365
+    
+    # Calculate savings (only generation that offsets consumption counts)
+    monthly_avg_gen = annual_generation * _INV_12
+    monthly_savings = min(monthly_units, monthly_avg_gen) * tariff
+    annual_savings = monthly_savings * 12
+    
+    # Calculate payback
+    payback_years = total_investment / annual_savings if annual_savings > 0 else 999
+    annual_roi = (annual_savings / total_investment) * 100 if total_investment > 0 else 0
+    
+    return (system_size, total_investment, annual_generation, daily_average,
+            monthly_savings, annual_savings, payback_years, annual_roi)
+
+# Cached core of calculate_solar_roi
+@st.cache_data(show_spinner=False, max_entries=256, ttl=3600)
+def _calculate_roi_fields(monthly_units, tariff, rooftop_area,
+                          weather_condition, dominant_season, dust_pollution):
+    """
+    Return the ROI fields as a plain tuple (the script-defined ROI class can't be pickled)
+    """
+    # Weather-adjusted irradiance (precomputed for every known combination)
+    weather_factor = _WEATHER_FACTORS.get(weather_condition, 1.0)
+    solar_irradiance = _IRRADIANCE_TABLE.get((weather_condition, dominant_season, dust_pollution))
+    if solar_irradiance is None:
+        solar_irradiance = (_BASE_SOLAR_IRRADIANCE * weather_factor
+                            * _SEASON_FACTORS.get(dominant_season, 1.0)
+                            * _DUST_FACTORS.get(dust_pollution, 1.0))
+    
+    (system_size, total_investment, annual_generation, daily_average,
+     monthly_savings, annual_savings, payback_years, annual_roi) = _roi_math(
+        monthly_units, tariff, rooftop_area, solar_irradiance)
+    
+    # Monthly generation with weather-adjusted seasonal variation
+    # (monsoon reduces generation during Jun-Sep)
+    if dominant_season == 'Monsoon':
+        monthly_gen_factors = _MONSOON_MONTHLY_GEN_FACTORS
+    else:
+        monthly_gen_factors = _MONTHLY_GEN_FACTORS
+    
+    monthly_generation = annual_generation * monthly_gen_factors
+    
+    # 20-year projections
+    cumulative_savings = annual_savings * _YEARS
+    total_20_year_savings = float(cumulative_savings[-1])
+    net_profit = total_20_year_savings - total_investment
+    
+    # Determine suitability with weather considerations
+    weather_score_adjustment = weather_factor * 10  # Scale weather impact
+    base_score = 60
+    
+    for max_payback, min_generation, suitability, bonus, max_score in _SUITABILITY_LADDER:
+        if payback_years < max_payback and annual_generation > monthly_units * min_generation:
+            break
+    else:
+        suitability, bonus, max_score = _SUITABILITY_DEFAULT
+    solar_score = min(max_score, base_score + bonus + weather_score_adjustment)
+    
+    return (suitability, solar_score, system_size, total_investment, annual_generation,
+            daily_average, solar_irradiance, monthly_generation, monthly_savings, annual_savings,
+            payback_years, annual_roi, cumulative_savings, total_20_year_savings, net_profit,
+            weather_factor, solar_irradiance)
+
+def calculate_solar_roi(monthly_units, tariff, rooftop_area,
+                        weather_condition='Sunny', dominant_season='Summer', dust_pollution='Low'):
+    """
+    Enhanced ROI calculation with weather integration
+    """
+    return ROI(*_calculate_roi_fields(monthly_units, tariff, rooftop_area,
+                                      weather_condition, dominant_season, dust_pollution))
+
+# Savings chart builder - cached so reruns with unchanged results skip Plotly validation.
+# st.cache_resource hands back the stored figure itself; st.cache_data would unpickle
+# it, which re-runs the Figure constructor and its validation on every hit.
+@st.cache_resource(max_entries=64)
+def _build_savings_fig(cumulative_savings, investment):
+    # Plotly is only needed for this chart, so import it on first use
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=_YEARS, y=cumulative_savings, 
+                           mode='lines+markers',
+                           name='Cumulative Savings',
+                           line=dict(color='green', width=3)))
+    fig.add_hline(y=investment, 
+                 line_dash="dash", line_color="red",
+                 annotation_text="Break-even Point")
+    fig.update_layout(title="20-Year Savings Projection (Weather-Adjusted)",
+                    xaxis_title="Year",
+                    yaxis_title="Cumulative Savings (₹)")
+    return fig
+
+
+# Page configuration
+st.set_page_config(
+    page_title="Smart Solar ROI Predictor for MSMEs",
+    page_icon="☀️",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for better styling
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 # Header
-st.markdown("""
-<div class="main-header">
-    <h1>🌞 Smart Solar ROI Predictor for MSMEs</h1>
-    <p>Discover if solar energy is right for your business - Get instant ROI analysis with weather intelligence!</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # Sidebar for navigation
 with st.sidebar:
@@ -200,217 +335,198 @@ with st.sidebar:
 if 'calculated' not in st.session_state:
     st.session_state.calculated = False
 if 'results' not in st.session_state:
-    st.session_state.results = {}
+    st.session_state.results = None
+# Streamlit drops the state of keyed widgets that aren't rendered (e.g. on the Results
+# page); re-assigning every key on each run keeps the entered values across pages
+st.session_state.update({key: st.session_state.get(key, default)
+                         for key, default in _WIDGET_DEFAULTS.items()})
 
 # Page 1: Input Details
 if page == "📝 Input Details":
     st.header("🏢 Enter Your Business Details")
     
-    # Create two columns for better layout
-    col1, col2 = st.columns(2)
+    # Input modes decide which fields the form shows, so they live outside it
+    # and re-render the form as soon as they change
+    mode_col1, mode_col2 = st.columns(2)
     
-    with col1:
-        st.subheader("📍 Location & Property Details")
-        
-        indian_cities = [
-    "Agartala", "Agra", "Ahmedabad", "Ahmednagar", "Aizawl", "Ajmer", "Akola", "Alappuzha", "Aligarh",
-    "Allahabad", "Alwar", "Ambala", "Amravati", "Amritsar", "Anantapur", "Anand", "Asansol", "Aurangabad",
-    "Azamgarh", "Bangalore", "Baran", "Bareilly", "Bathinda", "Begusarai", "Belagavi", "Bellary", "Berhampur",
-    "Bhagalpur", "Bharatpur", "Bharuch", "Bhavnagar", "Bhilai", "Bhilwara", "Bhopal", "Bhubaneswar", "Bhuj",
-    "Bidar", "Bikaner", "Bilaspur", "Bokaro", "Chandigarh", "Chandrapur", "Chennai", "Chhindwara", "Chittoor",
-    "Coimbatore", "Cuttack", "Daman", "Darbhanga", "Darjeeling", "Davanagere", "Dehradun", "Delhi", "Dewas",
-    "Dhanbad", "Dhar", "Dhule", "Dibrugarh", "Dindigul", "Dispur", "Durg", "Durgapur", "Erode", "Etawah",
-    "Faizabad", "Faridabad", "Farrukhabad", "Fatehpur", "Firozabad", "Gandhinagar", "Gaya", "Ghaziabad",
-    "Ghazipur", "Gorakhpur", "Greater Noida", "Gulbarga", "Guna", "Guntur", "Gurgaon", "Guwahati", "Gwalior",
-    "Hajipur", "Haldia", "Haldwani", "Haridwar", "Hassan", "Hisar", "Hosur", "Hubli", "Hyderabad", "Ichalkaranji",
-    "Imphal", "Indore", "Itanagar", "Jabalpur", "Jagdalpur", "Jagraon", "Jaipur", "Jalandhar", "Jalgaon", "Jammu",
-    "Jamnagar", "Jamshedpur", "Jhansi", "Jhunjhunu", "Jodhpur", "Junagadh", "Kadapa", "Kaithal", "Kakinada",
-    "Kalaburagi", "Kalyan", "Kanchipuram", "Kannur", "Kanpur", "Kapurthala", "Karimnagar", "Karnal", "Karur",
-    "Katni", "Kharagpur", "Kochi", "Kolhapur", "Kolkata", "Kollam", "Korba", "Kota", "Kottayam", "Kozhikode",
-    "Krishnanagar", "Kurnool", "Latur", "Loni", "Lucknow", "Ludhiana", "Madurai", "Maheshtala", "Malda",
-    "Malegaon", "Mangalore", "Mathura", "Meerut", "Mirzapur", "Moradabad", "Morena", "Mumbai", "Muzaffarnagar",
-    "Muzaffarpur", "Mysore", "Nadiad", "Nagapattinam", "Nagercoil", "Nagpur", "Nanded", "Nashik", "Navi Mumbai",
-    "Neemuch", "Nellore", "Nizamabad", "Noida", "Ongole", "Orai", "Ooty", "Palakkad", "Palanpur", "Pali",
-    "Panaji", "Panchkula", "Panipat", "Parbhani", "Pathankot", "Patiala", "Patna", "Pimpri-Chinchwad", "Porbandar",
-    "Prayagraj", "Puducherry", "Pune", "Puri", "Raebareli", "Raichur", "Raigarh", "Raipur", "Rajahmundry",
-    "Rajkot", "Ranchi", "Ratlam", "Rewa", "Rewari", "Rohtak", "Roorkee", "Rourkela", "Sagar", "Saharanpur",
-    "Salem", "Sambalpur", "Sangli", "Sangrur", "Satara", "Satna", "Secunderabad", "Serampore", "Shillong",
-    "Shimla", "Shivpuri", "Sikar", "Silchar", "Siliguri", "Solapur", "Sonipat", "Srinagar", "Surat", "Tenali",
-    "Tezpur", "Thane", "Thanjavur", "Thiruvananthapuram", "Thoothukudi", "Thrissur", "Tinsukia", "Tiruchirappalli",
-    "Tirunelveli", "Tirupati", "Tiruppur", "Tiruvannamalai", "Udaipur", "Udupi", "Ujjain", "Ulhasnagar",
-    "Una", "Unnao", "Vadodara", "Valsad", "Varanasi", "Vasai-Virar", "Vellore", "Vidisha", "Vijayawada",
-    "Viluppuram", "Virar", "Visakhapatnam", "Warangal", "Wardha", "Yamunanagar",      "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh", "Goa",
-    "Gujarat", "Haryana", "Himachal Pradesh", "Jharkhand", "Karnataka", "Kerala",
-    "Madhya Pradesh", "Maharashtra", "Manipur", "Meghalaya", "Mizoram", "Nagaland",
-    "Odisha", "Punjab", "Rajasthan", "Sikkim", "Tamil Nadu", "Telangana",
-    "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal",
-    "Andaman and Nicobar Islands", "Chandigarh", "Dadra and Nagar Haveli and Daman and Diu",
-    "Delhi", "Jammu and Kashmir", "Ladakh", "Lakshadweep", "Puducherry"
-]
-        location = st.selectbox(
-                    "Select Your Business Location", 
-                    [""] + sorted(indian_cities),
-                    index=0
-        )
-
-        # Rooftop area
+    with mode_col1:
         area_method = st.radio("How do you want to provide rooftop area?", 
-                              ["Manual Input", "Estimate from Building Size"])
-        
-        if area_method == "Manual Input":
-            rooftop_area = st.number_input("Available Rooftop Area (sq ft)", 
-                                          min_value=100, max_value=10000, value=1000)
-        else:
-            building_length = st.number_input("Building Length (ft)", min_value=10, value=50)
-            building_width = st.number_input("Building Width (ft)", min_value=10, value=40)
-            rooftop_area = building_length * building_width
-            st.info(f"Estimated rooftop area: {rooftop_area} sq ft")
-        
-        # Roof details
-        roof_type = st.selectbox("🏠 Roof Type", 
-                                ["Flat Roof", "Sloped Roof", "Mixed"])
-        
-        roof_condition = st.selectbox("Roof Condition", 
-                                     ["Excellent", "Good", "Average", "Needs Repair"])
+                              ["Manual Input", "Estimate from Building Size"], key="area_method")
     
-    with col2:
-        st.subheader("⚡ Electricity Usage Details")
-        
-        # Business type
-        business_type = st.selectbox("🏢 Type of Business", [
-            "Manufacturing", "Retail Store", "Office", "Restaurant", 
-            "Hospital/Clinic", "School", "Warehouse", "Hotel", "Other"
-        ])
-        
-        # Electricity bill method
+    with mode_col2:
         bill_method = st.radio("How do you want to provide electricity data?", 
-                              ["Monthly Bill Amount", "Monthly Units (kWh)"])
-        
-        if bill_method == "Monthly Bill Amount":
-            monthly_bill = st.number_input("Average Monthly Electricity Bill (₹)", 
-                                          min_value=1000, max_value=100000, value=15000)
-            # Estimate units based on average tariff
-            avg_tariff = st.slider("Average Electricity Rate (₹/kWh)", 
-                                  min_value=3.0, max_value=12.0, value=6.5)
-            monthly_units = monthly_bill / avg_tariff
-            st.info(f"Estimated monthly consumption: {monthly_units:.0f} kWh")
-        else:
-            monthly_units = st.number_input("Monthly Electricity Consumption (kWh)", 
-                                           min_value=500, max_value=20000, value=2000)
-            avg_tariff = st.slider("Average Electricity Rate (₹/kWh)", 
-                                  min_value=3.0, max_value=12.0, value=6.5)
-            monthly_bill = monthly_units * avg_tariff
-            st.info(f"Estimated monthly bill: ₹{monthly_bill:.0f}")
-        
-        # Operating hours
-        operating_hours = st.slider("🕐 Daily Operating Hours", 
-                                   min_value=6, max_value=24, value=10)
-        
-        # Budget
-        budget_range = st.selectbox("💰 Budget Range for Solar Installation", [
-            "₹1-3 Lakhs", "₹3-5 Lakhs", "₹5-10 Lakhs", "₹10-20 Lakhs", "₹20+ Lakhs"
-        ])
+                              ["Monthly Bill Amount", "Monthly Units (kWh)"], key="bill_method")
+    
+    previous_solar = st.radio("🔄 Previous Solar Experience?", ["No", "Yes"], key="previous_solar")
+    
+    # Remaining widgets are batched in a form so edits only rerun on submit
+    with st.form("solar_inputs"):
+        # Create two columns for better layout
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            st.subheader("📍 Location & Property Details")
+        
+            location = st.selectbox(
+                        "Select Your Business Location", 
+                        _LOCATIONS,
+                        format_func=lambda loc: f"{loc} (State/UT)" if loc in _STATE_UT_SET else loc,
+                        index=None,
+                        placeholder="Select Your Business Location"
+            )
 
-    # NEW WEATHER SECTION
-    st.subheader("🌤️ Weather & Environmental Conditions")
-    
-    col5, col6 = st.columns(2)
-    
-    with col5:
-        st.markdown("##### Current Weather Patterns")
-        
-        # Current weather condition
-        weather_condition = st.selectbox("☀️ Typical Weather Condition", [
-            "Sunny", "Mostly Sunny", "Partly Cloudy", "Cloudy", "Rainy", "Very Cloudy"
-        ])
-        
-        # Dominant season
-        dominant_season = st.selectbox("🌿 Dominant Season (Most of the Year)", [
-            "Summer", "Winter", "Monsoon", "Post-Monsoon"
-        ])
-        
-        # Average sunny days
-        sunny_days = st.slider("☀️ Average Sunny Days per Month", 
-                              min_value=5, max_value=30, value=20)
-        
-        # Temperature range
-        temp_range = st.selectbox("🌡️ Average Temperature Range", [
-            "Very Hot (>40°C)", "Hot (30-40°C)", "Moderate (20-30°C)", 
-            "Cool (10-20°C)", "Cold (<10°C)"
-        ])
-    
-    with col6:
-        st.markdown("##### Environmental Factors")
-        
-        # Dust and pollution
-        dust_pollution = st.selectbox("🌫️ Dust/Air Pollution Level", [
-            "Low", "Medium", "High"
-        ])
-        
-        # Shading issues
-        shading_issues = st.selectbox("🌳 Roof Shading Issues", [
-            "No Shading", "Partial Shading (Morning)", "Partial Shading (Afternoon)", 
-            "Heavy Shading", "Seasonal Shading"
-        ])
-        
-        # Monsoon intensity
-        monsoon_intensity = st.selectbox("🌧️ Monsoon Intensity", [
-            "Light", "Moderate", "Heavy", "Very Heavy"
-        ])
-        
-        # Wind conditions
-        wind_conditions = st.selectbox("💨 Wind Conditions", [
-            "Calm", "Light Breeze", "Moderate Wind", "Strong Wind", "Very Windy"
-        ])
-    
-    # Weather impact info
-    st.markdown("""
-    <div class="weather-info">
-        <h4>🌦️ Weather Impact on Solar Performance</h4>
-        <p><strong>Why weather matters:</strong> Solar panel efficiency depends heavily on sunlight exposure, 
-        temperature, and environmental conditions. Our AI considers these factors to give you accurate ROI predictions.</p>
-        <ul>
-            <li><strong>Sunny conditions:</strong> Maximum solar generation</li>
-            <li><strong>Cloudy/Rainy days:</strong> Reduced but still significant generation</li>
-            <li><strong>Dust/Pollution:</strong> Can reduce efficiency by 10-20%</li>
-            <li><strong>Temperature:</strong> Extreme heat can slightly reduce efficiency</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Additional details
-    st.subheader("📋 Additional Information")
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        priority = st.selectbox("🎯 Primary Goal", [
-            "Reduce Electricity Bills", "Environmental Impact", "Energy Independence", 
-            "Government Incentives", "Increase Property Value"
-        ])
-        
-        timeline = st.selectbox("⏱️ Expected Installation Timeline", [
-            "Within 3 months", "3-6 months", "6-12 months", "Just exploring"
-        ])
-    
-    with col4:
-        previous_solar = st.radio("🔄 Previous Solar Experience?", ["No", "Yes"])
-        
-        if previous_solar == "Yes":
-            solar_experience = st.text_area("Tell us about your previous solar experience")
-        
-        # Contact for follow-up
-        contact_consent = st.checkbox("📞 I consent to be contacted for solar installation quotes")
-    
-    # Calculate button
-    st.markdown("---")
-    if st.button("🚀 Calculate Weather-Adjusted Solar ROI", type="primary", use_container_width=True):
-        if location and rooftop_area > 0 and monthly_units > 0:
+            # Rooftop area
+            if area_method == "Manual Input":
+                rooftop_area = st.number_input("Available Rooftop Area (sq ft)", 
+                                              min_value=100, max_value=10000, key="rooftop_area")
+            else:
+                building_length = st.number_input("Building Length (ft)", min_value=10, key="building_length")
+                building_width = st.number_input("Building Width (ft)", min_value=10, key="building_width")
+                rooftop_area = building_length * building_width
+                st.info(f"Estimated rooftop area: {rooftop_area} sq ft")
+        
+            # Roof details
+            roof_type = st.selectbox("🏠 Roof Type", 
+                                    ["Flat Roof", "Sloped Roof", "Mixed"])
+        
+            roof_condition = st.selectbox("Roof Condition", 
+                                         ["Excellent", "Good", "Average", "Needs Repair"])
+    
+        with col2:
+            st.subheader("⚡ Electricity Usage Details")
+        
+            # Business type
+            business_type = st.selectbox("🏢 Type of Business", [
+                "Manufacturing", "Retail Store", "Office", "Restaurant", 
+                "Hospital/Clinic", "School", "Warehouse", "Hotel", "Other"
+            ])
+        
+            if bill_method == "Monthly Bill Amount":
+                monthly_bill = st.number_input("Average Monthly Electricity Bill (₹)", 
+                                              min_value=1000, max_value=100000, key="monthly_bill")
+                # Estimate units based on average tariff
+                avg_tariff = st.slider("Average Electricity Rate (₹/kWh)", 
+                                      min_value=3.0, max_value=12.0, key="avg_tariff")
+                monthly_units = monthly_bill / avg_tariff
+                st.info(f"Estimated monthly consumption: {monthly_units:.0f} kWh")
+            else:
+                monthly_units = st.number_input("Monthly Electricity Consumption (kWh)", 
+                                               min_value=500, max_value=20000, key="monthly_units")
+                avg_tariff = st.slider("Average Electricity Rate (₹/kWh)", 
+                                      min_value=3.0, max_value=12.0, key="avg_tariff")
+                monthly_bill = monthly_units * avg_tariff
+                st.info(f"Estimated monthly bill: ₹{monthly_bill:.0f}")
+        
+            # Operating hours
+            operating_hours = st.slider("🕐 Daily Operating Hours", 
+                                       min_value=6, max_value=24, key="operating_hours")
+        
+            # Budget
+            budget_range = st.selectbox("💰 Budget Range for Solar Installation", [
+                "₹1-3 Lakhs", "₹3-5 Lakhs", "₹5-10 Lakhs", "₹10-20 Lakhs", "₹20+ Lakhs"
+            ])
+
+        # NEW WEATHER SECTION
+        st.subheader("🌤️ Weather & Environmental Conditions")
+    
+        col5, col6 = st.columns(2)
+    
+        with col5:
+            st.markdown("##### Current Weather Patterns")
+        
+            # Current weather condition
+            weather_condition = st.selectbox("☀️ Typical Weather Condition", [
+                "Sunny", "Mostly Sunny", "Partly Cloudy", "Cloudy", "Rainy", "Very Cloudy"
+            ])
+        
+            # Dominant season
+            dominant_season = st.selectbox("🌿 Dominant Season (Most of the Year)", [
+                "Summer", "Winter", "Monsoon", "Post-Monsoon"
+            ])
+        
+            # Average sunny days
+            sunny_days = st.slider("☀️ Average Sunny Days per Month", 
+                                  min_value=5, max_value=30, key="sunny_days")
+        
+            # Temperature range
+            temp_range = st.selectbox("🌡️ Average Temperature Range", [
+                "Very Hot (>40°C)", "Hot (30-40°C)", "Moderate (20-30°C)", 
+                "Cool (10-20°C)", "Cold (<10°C)"
+            ])
+    
+        with col6:
+            st.markdown("##### Environmental Factors")
+        
+            # Dust and pollution
+            dust_pollution = st.selectbox("🌫️ Dust/Air Pollution Level", [
+                "Low", "Medium", "High"
+            ])
+        
+            # Shading issues
+            shading_issues = st.selectbox("🌳 Roof Shading Issues", [
+                "No Shading", "Partial Shading (Morning)", "Partial Shading (Afternoon)", 
+                "Heavy Shading", "Seasonal Shading"
+            ])
+        
+            # Monsoon intensity
+            monsoon_intensity = st.selectbox("🌧️ Monsoon Intensity", [
+                "Light", "Moderate", "Heavy", "Very Heavy"
+            ])
+        
+            # Wind conditions
+            wind_conditions = st.selectbox("💨 Wind Conditions", [
+                "Calm", "Light Breeze", "Moderate Wind", "Strong Wind", "Very Windy"
+            ])
+    
+        # Weather impact info
+        st.markdown("""
+        <div class="weather-info">
+            <h4>🌦️ Weather Impact on Solar Performance</h4>
+            <p><strong>Why weather matters:</strong> Solar panel efficiency depends heavily on sunlight exposure, 
+            temperature, and environmental conditions. Our AI considers these factors to give you accurate ROI predictions.</p>
+            <ul>
+                <li><strong>Sunny conditions:</strong> Maximum solar generation</li>
+                <li><strong>Cloudy/Rainy days:</strong> Reduced but still significant generation</li>
+                <li><strong>Dust/Pollution:</strong> Can reduce efficiency by 10-20%</li>
+                <li><strong>Temperature:</strong> Extreme heat can slightly reduce efficiency</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+        # Additional details
+        st.subheader("📋 Additional Information")
+        col3, col4 = st.columns(2)
+    
+        with col3:
+            priority = st.selectbox("🎯 Primary Goal", [
+                "Reduce Electricity Bills", "Environmental Impact", "Energy Independence", 
+                "Government Incentives", "Increase Property Value"
+            ])
+        
+            timeline = st.selectbox("⏱️ Expected Installation Timeline", [
+                "Within 3 months", "3-6 months", "6-12 months", "Just exploring"
+            ])
+    
+        with col4:
+            if previous_solar == "Yes":
+                solar_experience = st.text_area("Tell us about your previous solar experience")
+        
+            # Contact for follow-up
+            contact_consent = st.checkbox("📞 I consent to be contacted for solar installation quotes")
+    
+        # Calculate button
+        st.markdown("---")
+        submitted = st.form_submit_button("🚀 Calculate Weather-Adjusted Solar ROI", type="primary", width="stretch")
+    
+    if submitted:
+        if location in _LOCATION_SET and rooftop_area > 0 and monthly_units > 0:
             # Store inputs in session state
             st.session_state.inputs = {
                 'location': location,
                 'rooftop_area': rooftop_area,
                 'monthly_units': monthly_units,
                 'monthly_bill': monthly_bill,
+                'tariff': avg_tariff,
                 'business_type': business_type,
                 'operating_hours': operating_hours,
                 'budget_range': budget_range,
@@ -430,8 +546,10 @@ if page == "📝 Input Details":
                 'wind_conditions': wind_conditions
             }
             
-            # Perform calculations
-            st.session_state.results = calculate_solar_roi(st.session_state.inputs)
+            # Perform calculations (memoized by calculate_solar_roi's cache)
+            st.session_state.results = calculate_solar_roi(
+                monthly_units, avg_tariff, rooftop_area,
+                weather_condition, dominant_season, dust_pollution)
             st.session_state.calculated = True
             
             st.success("✅ Weather-adjusted calculation completed! Go to 'Results & Analysis' to view your detailed report.")
@@ -446,6 +564,11 @@ elif page == "📊 Results & Analysis":
         results = st.session_state.results
         inputs = st.session_state.inputs
         
+        # Values read by several widgets below
+        weather_impact = results.weather_impact
+        effective_irradiance = results.effective_irradiance
+        total_investment = results.total_investment
+        
         # Weather impact summary
         st.markdown("""
         <div class="weather-info">
@@ -456,14 +579,14 @@ elif page == "📊 Results & Analysis":
         col_weather1, col_weather2, col_weather3 = st.columns(3)
         
         with col_weather1:
-            st.metric("🌤️ Weather Impact Factor", f"{results['weather_impact']:.2f}", 
-                     delta="1.0 = Ideal" if results['weather_impact'] >= 1.0 else "Below Ideal")
+            st.metric("🌤️ Weather Impact Factor", f"{weather_impact:.2f}", 
+                     delta="1.0 = Ideal" if weather_impact >= 1.0 else "Below Ideal")
         
         with col_weather2:
-            st.metric("☀️ Effective Solar Irradiance", f"{results['effective_irradiance']:.1f} kWh/m²/day")
+            st.metric("☀️ Effective Solar Irradiance", f"{effective_irradiance:.1f} kWh/m²/day")
         
         with col_weather3:
-            weather_status = "Excellent" if results['weather_impact'] >= 0.95 else "Good" if results['weather_impact'] >= 0.85 else "Fair"
+            weather_status = "Excellent" if weather_impact >= 0.95 else "Good" if weather_impact >= 0.85 else "Fair"
             st.metric("🌈 Weather Suitability", weather_status)
         
         # Summary metrics
@@ -471,17 +594,17 @@ elif page == "📊 Results & Analysis":
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("🌟 Solar Suitability", results['suitability'], 
-                     delta=f"{results['solar_score']}/100")
+            st.metric("🌟 Solar Suitability", results.suitability, 
+                     delta=f"{results.solar_score}/100")
         
         with col2:
-            st.metric("💰 Total Investment", f"₹{results['total_investment']:,.0f}")
+            st.metric("💰 Total Investment", f"₹{total_investment:,.0f}")
         
         with col3:
-            st.metric("⏱️ Payback Period", f"{results['payback_years']:.1f} years")
+            st.metric("⏱️ Payback Period", f"{results.payback_years:.1f} years")
         
         with col4:
-            st.metric("📊 Annual ROI", f"{results['annual_roi']:.1f}%")
+            st.metric("📊 Annual ROI", f"{results.annual_roi:.1f}%")
         
         # Detailed results
         st.markdown("---")
@@ -491,26 +614,19 @@ elif page == "📊 Results & Analysis":
             st.subheader("☀️ Weather-Adjusted Solar Generation")
             
             # Solar generation chart
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            generation = results['monthly_generation']
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(x=months, y=generation, 
-                               name='Solar Generation (kWh)',
-                               marker_color='orange'))
-            fig.update_layout(title="Monthly Solar Generation Forecast (Weather-Adjusted)",
-                            xaxis_title="Month",
-                            yaxis_title="Generation (kWh)")
-            st.plotly_chart(fig, use_container_width=True)
+            st.markdown("**Monthly Solar Generation Forecast (Weather-Adjusted)**")
+            st.bar_chart({'Month': _MONTHS,
+                          'Generation (kWh)': results.monthly_generation},
+                         x='Month', y='Generation (kWh)', sort=False,
+                         color='#ffa500')
             
             # Key metrics
             st.markdown(f"""
             **Solar System Details:**
-            - **System Size**: {results['system_size']:.1f} kW
-            - **Annual Generation**: {results['annual_generation']:,.0f} kWh
-            - **Daily Average**: {results['daily_average']:.1f} kWh
-            - **Weather-Adjusted Irradiance**: {results['effective_irradiance']:.1f} kWh/m²/day
+            - **System Size**: {results.system_size:.1f} kW
+            - **Annual Generation**: {results.annual_generation:,.0f} kWh
+            - **Daily Average**: {results.daily_average:.1f} kWh
+            - **Weather-Adjusted Irradiance**: {effective_irradiance:.1f} kWh/m²/day
             """)
             
             # Weather conditions summary
@@ -526,29 +642,16 @@ elif page == "📊 Results & Analysis":
             st.subheader("💵 Financial Projections")
             
             # ROI over time
-            years = list(range(1, 21))
-            cumulative_savings = results['cumulative_savings']
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=years, y=cumulative_savings, 
-                                   mode='lines+markers',
-                                   name='Cumulative Savings',
-                                   line=dict(color='green', width=3)))
-            fig.add_hline(y=results['total_investment'], 
-                         line_dash="dash", line_color="red",
-                         annotation_text="Break-even Point")
-            fig.update_layout(title="20-Year Savings Projection (Weather-Adjusted)",
-                            xaxis_title="Year",
-                            yaxis_title="Cumulative Savings (₹)")
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _build_savings_fig(results.cumulative_savings, total_investment)
+            st.plotly_chart(fig, width="stretch")
             
             # Financial summary
             st.markdown(f"""
             **Financial Summary:**
-            - **Monthly Savings**: ₹{results['monthly_savings']:,.0f}
-            - **Annual Savings**: ₹{results['annual_savings']:,.0f}
-            - **20-Year Savings**: ₹{results['total_20_year_savings']:,.0f}
-            - **Net Profit (20 years)**: ₹{results['net_profit']:,.0f}
+            - **Monthly Savings**: ₹{results.monthly_savings:,.0f}
+            - **Annual Savings**: ₹{results.annual_savings:,.0f}
+            - **20-Year Savings**: ₹{results.total_20_year_savings:,.0f}
+            - **Net Profit (20 years)**: ₹{results.net_profit:,.0f}
             """)
         
         # Weather-specific recommendations
@@ -556,23 +659,9 @@ elif page == "📊 Results & Analysis":
         st.subheader("🌤️ Weather-Specific Insights")
         
         # Generate weather-specific recommendations
-        weather_recommendations = []
-        
-        if inputs['weather_condition'] in ['Cloudy', 'Very Cloudy']:
-            weather_recommendations.append("⚠️ Consider high-efficiency panels for cloudy conditions")
+        weather_recommendations = [message for key, values, message in _WEATHER_RULES
+                                   if inputs[key] in values]
         
-        if inputs['dust_pollution'] == 'High':
-            weather_recommendations.append("🧹 Plan for regular panel cleaning (monthly)")
-        
-        if inputs['dominant_season'] == 'Monsoon':
-            weather_recommendations.append("☔ Consider waterproof mounting and drainage systems")
-        
-        if inputs['monsoon_intensity'] in ['Heavy', 'Very Heavy']:
-            weather_recommendations.append("🌧️ Ensure robust structural support for heavy rains")
-        
-            if inputs['wind_conditions'] in ['Strong Wind', 'Very Windy']:
-                weather_recommendations.append("💨 Install wind-resistant mounting systems")
-
         # Display recommendations
         if weather_recommendations:
             for rec in weather_recommendations:
@@ -591,9 +680,9 @@ elif page == "💡 Recommendations":
         st.subheader("📌 Summary")
         st.markdown(f"""
         Based on your business details and environmental conditions in **{inputs['location']}**, here are our top insights:
-        - **Solar Suitability:** {results['suitability']}
-        - **Payback Period:** {results['payback_years']:.1f} years
-        - **Net Profit over 20 Years:** ₹{results['net_profit']:,.0f}
+        - **Solar Suitability:** {results.suitability}
+        - **Payback Period:** {results.payback_years:.1f} years
+        - **Net Profit over 20 Years:** ₹{results.net_profit:,.0f}
         """)
         
         st.markdown("---")